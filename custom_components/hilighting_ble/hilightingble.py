@@ -1,7 +1,9 @@
 import asyncio
 import logging
-from typing import Any, TypeVar, cast, Tuple
-from collections.abc import Callable
+import random
+import struct
+from contextlib import suppress
+from typing import Tuple
 
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth import async_ble_device_from_address
@@ -10,7 +12,7 @@ from homeassistant.exceptions import ConfigEntryNotReady
 
 from bleak.backends.device import BLEDevice
 from bleak.backends.service import BleakGATTCharacteristic, BleakGATTServiceCollection
-from bleak.exc import BleakDBusError
+from bleak.exc import BleakDBusError, BleakError
 from bleak_retry_connector import (
     BLEAK_RETRY_EXCEPTIONS as BLEAK_EXCEPTIONS,
     BleakClientWithServiceCache,
@@ -20,9 +22,10 @@ from bleak_retry_connector import (
 
 LOGGER = logging.getLogger(__name__)
 
-EFFECT_MAP = {f"Effect {i}": i for i in range(10)}
-EFFECT_LIST = sorted(EFFECT_MAP)
-EFFECT_ID_TO_NAME = {v: k for k, v in EFFECT_MAP.items()}
+_EFFECT_NAMES = tuple(f"Effect {i}" for i in range(10))
+EFFECT_MAP = {name: i for i, name in enumerate(_EFFECT_NAMES)}
+EFFECT_LIST = _EFFECT_NAMES
+EFFECT_ID_TO_NAME = _EFFECT_NAMES  # index by id directly
 
 WRITE_CHARACTERISTIC_UUID = "6e400002-b5a3-f393-e0a9-e50e24dcca9e"
 FIRMWARE_REVISION_UUID = "00002a26-0000-1000-8000-00805f9b34fb"
@@ -30,42 +33,52 @@ SW_NUMBER_UUID = "00002a28-0000-1000-8000-00805f9b34fb"
 MANUFACTURER_NAME_UUID = "00002a29-0000-1000-8000-00805f9b34fb"
 DEFAULT_ATTEMPTS = 3
 BLEAK_BACKOFF_TIME = 0.25
+BLEAK_BACKOFF_MAX = 2.0
+WRITE_COALESCE_DELAY = 0.02
 RETRY_BACKOFF_EXCEPTIONS = (BleakDBusError,)
+DEVICE_INFO_KEYS = ("model", "manufacturer_name", "firmware_version")
 
-WrapFuncType = TypeVar("WrapFuncType", bound=Callable[..., Any])
+_BRIGHTNESS_LUT = bytes(min(int(i * 0.06), 0x0f) for i in range(256))
+_SPEED_LUT = bytes(min(max(int(i * 2.55), 0), 255) for i in range(256))
 
-def retry_bluetooth_connection_error(func: WrapFuncType) -> WrapFuncType:
-    async def _async_wrap(self: "HILIGHTINGInstance", *args: Any, **kwargs: Any) -> Any:
-        for attempt in range(DEFAULT_ATTEMPTS):
-            try:
-                return await func(self, *args, **kwargs)
-            except BleakNotFoundError:
-                raise
-            except RETRY_BACKOFF_EXCEPTIONS as err:
-                if attempt == DEFAULT_ATTEMPTS - 1:
-                    LOGGER.error("%s: Max retries reached on %s: %s", self.name, func.__name__, err)
-                    raise
-                LOGGER.warning("%s: Retry %s/%s on %s due to %s", self.name, attempt+1, DEFAULT_ATTEMPTS, func.__name__, err)
-                await asyncio.sleep(BLEAK_BACKOFF_TIME)
-            except BLEAK_EXCEPTIONS as err:
-                if attempt == DEFAULT_ATTEMPTS - 1:
-                    LOGGER.error("%s: Max retries reached on %s: %s", self.name, func.__name__, err)
-                    raise
-                LOGGER.warning("%s: BLE error retry %s/%s on %s: %s", self.name, attempt+1, DEFAULT_ATTEMPTS, func.__name__, err)
-                await asyncio.sleep(BLEAK_BACKOFF_TIME)
+_RGB_TAIL = struct.Struct("3B")
 
-    return cast(WrapFuncType, _async_wrap)
+_RETRY_EXCEPTIONS = (*RETRY_BACKOFF_EXCEPTIONS, *BLEAK_EXCEPTIONS)
+
+
+class CharacteristicMissingError(BleakError):
+    """The write characteristic was not found on the connected device."""
 
 
 class HILIGHTINGInstance:
+    __slots__ = (
+        "_hass", "_mac", "_name", "_delay", "_data", "_options", "_device", "loop",
+        "_connect_lock", "_client",
+        "_is_connected", "_expected_disconnect", "_disconnect_timer", "_disconnect_task",
+        "_timer_expires_at", "_pending_writes", "_flush_handle", "_flush_task",
+        "_is_on", "_rgb_color", "_brightness", "_effect", "_color_mode",
+        "_write_char", "_write_fn", "_manufacturer_name_char", "_firmware_revision_char",
+        "_model_number_char", "_device_info_resolved", "_rgb_scratch", "_speed_scratch", "_model",
+        "_manufacturer_name", "_firmware_version",
+    )
+
+    TURN_ON_CMD = b"\x55\x01\x02\x01"
+    TURN_OFF_CMD = b"\x55\x01\x02\x00"
+    RGB_PREFIX = b"\x55\x07\x01"
+    BRIGHT_PREFIX = b"\x55\x03\x01\xff"
+    EFFECT_PREFIX = b"\x55\x04\x01"
+    SPEED_PREFIX = b"\x55\x04\x04"
+
     def __init__(
         self,
         hass,
         mac: str,
         delay: int = 30,
-        data: dict = {},
-        options: dict = {},
+        data: dict | None = None,
+        options: dict | None = None,
     ):
+        data = data or {}
+        options = options or {}
         self._hass = hass
         self._mac = mac
         self._name = f"HILIGHTING-{self._mac[-5:].replace(':', '')}"
@@ -80,9 +93,14 @@ class HILIGHTINGInstance:
         self.loop = asyncio.get_running_loop()
         self._connect_lock = asyncio.Lock()
         self._client: BleakClientWithServiceCache | None = None
-        self._cached_services: BleakGATTServiceCollection | None = None
+        self._is_connected = False
         self._expected_disconnect = False
         self._disconnect_timer: asyncio.TimerHandle | None = None
+        self._disconnect_task: asyncio.Task | None = None
+        self._timer_expires_at = 0.0
+        self._pending_writes: dict[str, bytes | bytearray] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task | None = None
 
         self._is_on = False
         self._rgb_color = (255, 255, 255)
@@ -90,17 +108,18 @@ class HILIGHTINGInstance:
         self._effect = EFFECT_OFF
         self._color_mode = ColorMode.RGB
 
-        self._write_uuid = None
+        self._write_char: BleakGATTCharacteristic | None = None
+        self._write_fn = None
         self._manufacturer_name_char = None
         self._firmware_revision_char = None
         self._model_number_char = None
+        self._device_info_resolved = False
 
-        self._turn_on_cmd = bytearray.fromhex("55 01 02 01")
-        self._turn_off_cmd = bytearray.fromhex("55 01 02 00")
+        # Coalesced commands are assembled in place; the queue only ever holds the latest value
+        self._rgb_scratch = bytearray(self.RGB_PREFIX + bytes(3))
+        self._speed_scratch = bytearray(self.SPEED_PREFIX + bytes(1))
 
-        self._model = data.get("model")
-        self._manufacturer_name = data.get("manufacturer_name")
-        self._firmware_version = data.get("firmware_version")
+        self._model, self._manufacturer_name, self._firmware_version = (data.get(key) for key in DEVICE_INFO_KEYS)
 
     @property
     def name(self):
@@ -134,57 +153,105 @@ class HILIGHTINGInstance:
     def color_mode(self):
         return self._color_mode
 
-    @retry_bluetooth_connection_error
     async def turn_on(self):
-        await self._write(self._turn_on_cmd)
+        await self._flush_pending_writes()
+        await self._write(self.TURN_ON_CMD)
         self._is_on = True
 
-    @retry_bluetooth_connection_error
     async def turn_off(self):
-        await self._write(self._turn_off_cmd)
+        await self._flush_pending_writes()
+        await self._write(self.TURN_OFF_CMD)
         self._is_on = False
 
-    @retry_bluetooth_connection_error
     async def set_rgb_color(self, rgb: Tuple[int, int, int]):
         self._rgb_color = rgb
-        packet = bytearray([0x55, 0x07, 0x01, rgb[0], rgb[1], rgb[2]])
-        await self._write(packet)
+        _RGB_TAIL.pack_into(self._rgb_scratch, 3, *rgb)
+        self._queue_write("rgb", self._rgb_scratch)
         self._effect = EFFECT_OFF
 
-    @retry_bluetooth_connection_error
     async def set_brightness(self, brightness: int):
         self._brightness = brightness
-        b = min(int(brightness * 0.06), 0x0f)
-        packet = bytearray([0x55, 0x03, 0x01, 0xff, b])
-        await self._write(packet)
+        b = _BRIGHTNESS_LUT[min(max(brightness, 0), 255)]
+        packet = self.BRIGHT_PREFIX + bytes((b,))
+        self._queue_write("bright", packet)
 
-    @retry_bluetooth_connection_error
     async def set_effect(self, effect: str):
-        if effect not in EFFECT_MAP:
+        # Names are "Effect 0".."Effect 9", so the id is the trailing digit
+        if len(effect) != 8 or not effect.startswith("Effect ") or not "0" <= effect[7] <= "9":
             LOGGER.error("Unsupported effect: %s", effect)
             return
-        effect_id = EFFECT_MAP[effect]
-        packet = bytearray([0x55, 0x04, 0x01, effect_id])
+        effect_id = ord(effect[7]) - 48
+        packet = self.EFFECT_PREFIX + bytes((effect_id,))
+        await self._flush_pending_writes()
         await self._write(packet)
         self._effect = effect
 
-    @retry_bluetooth_connection_error
     async def set_effect_speed(self, speed: int):
-        speed_byte = min(max(int(speed * 2.55), 0), 255)
-        packet = bytearray([0x55, 0x04, 0x04, speed_byte])
-        await self._write(packet)
-
-    async def _write(self, data: bytearray):
-        await self._ensure_connected()
-        await self._client.write_gatt_char(self._write_uuid, data, False)
+        self._speed_scratch[3] = _SPEED_LUT[min(max(speed, 0), 255)]
+        self._queue_write("speed", self._speed_scratch)
+
+    def _queue_write(self, channel: str, packet: bytes | bytearray):
+        # Latest value wins: slider drags only send what is current when the timer fires.
+        # The setter returns before the write, so BLE failures are logged by the drainer
+        # rather than raised to the service call.
+        self._pending_writes[channel] = packet
+        if self._flush_handle is None:
+            self._flush_handle = self.loop.call_later(WRITE_COALESCE_DELAY, self._flush)
+
+    def _flush(self):
+        self._flush_handle = None
+        # A running drainer picks up anything queued while it is writing
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self.loop.create_task(self._drain_pending_writes())
+
+    async def _drain_pending_writes(self):
+        while self._pending_writes:
+            channel = next(iter(self._pending_writes))
+            packet = self._pending_writes.pop(channel)
+            try:
+                await self._write(packet)
+            except BleakNotFoundError as err:
+                LOGGER.error("%s: Failed to send queued %s write: %s", self.name, channel, err)
+            except _RETRY_EXCEPTIONS:
+                # Already logged by _write once retries ran out
+                pass
+            except Exception:
+                LOGGER.exception("%s: Failed to send queued %s write", self.name, channel)
+
+    async def _flush_pending_writes(self):
+        # Send queued writes before an immediate command so they cannot land after it
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending_writes:
+            self._flush()
+        # Shielded so cancelling the caller does not cancel the shared drainer
+        while self._flush_task is not None and not self._flush_task.done():
+            await asyncio.shield(self._flush_task)
+
+    async def _write(self, data: bytes | bytearray):
+        for attempt in range(DEFAULT_ATTEMPTS):
+            try:
+                await self._ensure_connected()
+                await self._write_fn(self._write_char, data, False)
+                return
+            except BleakNotFoundError:
+                raise
+            except _RETRY_EXCEPTIONS as err:
+                if attempt == DEFAULT_ATTEMPTS - 1:
+                    LOGGER.error("%s: Max retries reached on write: %s", self.name, err)
+                    raise
+                LOGGER.warning("%s: Retry %s/%s on write due to %s", self.name, attempt+1, DEFAULT_ATTEMPTS, err)
+                await asyncio.sleep(min(BLEAK_BACKOFF_TIME * (2 ** attempt), BLEAK_BACKOFF_MAX) * (0.5 + random.random() * 0.5))
 
     async def _ensure_connected(self):
-        if self._client and self._client.is_connected:
+        if self._is_connected:
             self._reset_disconnect_timer()
             return
 
         async with self._connect_lock:
             if self._client and self._client.is_connected:
+                self._is_connected = True
                 self._reset_disconnect_timer()
                 return
 
@@ -194,48 +261,72 @@ class HILIGHTINGInstance:
                 self._device,
                 self.name,
                 self._disconnected,
-                use_cached_services=True,
+                use_services_cache=True,
                 ble_device_callback=lambda: self._device,
             )
 
-            if not self._resolve_characteristics(client.services):
-                LOGGER.debug("Initial resolve failed, trying with fresh services")
-                await client.get_services()
-                self._resolve_characteristics(client.services)
+            if not self._resolve_write_characteristic(client.services):
+                # The services cache may be stale; clear it so the retry reconnects with a full discovery
+                LOGGER.debug("%s: Write characteristic not found, clearing services cache", self.name)
+                self._expected_disconnect = True
+                with suppress(*BLEAK_EXCEPTIONS):
+                    await client.clear_cache()
+                with suppress(*BLEAK_EXCEPTIONS):
+                    await client.disconnect()
+                raise CharacteristicMissingError(f"{self.name}: Write characteristic {WRITE_CHARACTERISTIC_UUID} not found")
 
             self._client = client
-            self._cached_services = client.services
+            self._write_fn = client.write_gatt_char
+            self._is_connected = True
+            if not self._device_info_resolved and not all(key in self._data for key in DEVICE_INFO_KEYS):
+                self._resolve_device_info_characteristics(client.services)
             self._reset_disconnect_timer()
 
-    def _resolve_characteristics(self, services: BleakGATTServiceCollection) -> bool:
-        self._write_uuid = services.get_characteristic(WRITE_CHARACTERISTIC_UUID)
+    def _resolve_write_characteristic(self, services: BleakGATTServiceCollection) -> bool:
+        self._write_char = services.get_characteristic(WRITE_CHARACTERISTIC_UUID)
+        return self._write_char is not None
+
+    def _resolve_device_info_characteristics(self, services: BleakGATTServiceCollection) -> None:
+        self._device_info_resolved = True
         self._manufacturer_name_char = services.get_characteristic(MANUFACTURER_NAME_UUID)
         self._firmware_revision_char = services.get_characteristic(FIRMWARE_REVISION_UUID)
         self._model_number_char = services.get_characteristic(SW_NUMBER_UUID)
-        return all([self._write_uuid, self._manufacturer_name_char, self._firmware_revision_char, self._model_number_char])
 
     def _reset_disconnect_timer(self):
+        self._expected_disconnect = False
+        now = self.loop.time()
+        # Leave a timer with more than half its delay to run alone rather than re-arm it on every write
+        if self._disconnect_timer and self._timer_expires_at - now > self._delay / 2:
+            return
         if self._disconnect_timer:
             self._disconnect_timer.cancel()
-        self._expected_disconnect = False
+            self._disconnect_timer = None
         if self._delay:
-            self._disconnect_timer = self.loop.call_later(self._delay, self._disconnect)
+            self._timer_expires_at = now + self._delay
+            self._disconnect_timer = self.loop.call_at(self._timer_expires_at, self._disconnect)
 
     def _disconnected(self, client):
+        self._is_connected = False
         if self._expected_disconnect:
-            LOGGER.debug("%s: Disconnected (expected)", self.name)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("%s: Disconnected (expected)", self.name)
         else:
             LOGGER.warning("%s: Unexpected disconnect", self.name)
 
     def _disconnect(self):
         self._disconnect_timer = None
-        asyncio.create_task(self._execute_disconnect())
+        self._disconnect_task = self.loop.create_task(self._execute_disconnect())
 
     async def _execute_disconnect(self):
         async with self._connect_lock:
-            if self._client and self._client.is_connected:
+            # Drop references before awaiting so new writes reconnect instead of racing the disconnect
+            client = self._client
+            self._client = None
+            self._write_char = None
+            self._write_fn = None
+            if client is not None and self._is_connected:
                 self._expected_disconnect = True
-                await self._client.disconnect()
+                self._is_connected = False
+                with suppress(*BLEAK_EXCEPTIONS):
+                    await client.disconnect()
                 LOGGER.debug("%s: Disconnected", self.name)
-            self._client = None
-            self._write_uuid = None